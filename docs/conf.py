@@ -5,7 +5,7 @@
 
 import os
 import sys
-from datetime import datetime
+import time
 
 # -- Path setup --------------------------------------------------------------
 # Add the project root directory to the path so that autodoc can find modules
@@ -14,7 +14,7 @@ sys.path.insert(0, os.path.abspath('../envdot'))
 
 # -- Project information -----------------------------------------------------
 project = 'envdot'
-copyright = f'{datetime.now().year}, Hadi Cahyadi'
+copyright = f'{time.localtime().tm_year}, Hadi Cahyadi'
 author = 'Hadi Cahyadi'
 
 # The full version, including alpha/beta/rc tags
@@ -10,9 +10,9 @@ envdot: Enhanced environment variable management with multi-format support
 Supports .env, .json, .yaml, .yml, and .ini files with automatic type detection
 """
 
-from .core import DotEnv, load_env, get_env, set_env, save_env, show, data, Env
-from .exceptions import DotEnvError, FileNotFoundError, ParseError, TypeConversionError
-from .helpers import getenv_typed, getenv_int, getenv_float, getenv_bool, getenv_str, setenv_typed, patch_os_module
+from .core import DotEnv, load_env, load_env_from_string, get_env, set_env, save_env, show, data, Env
+from .exceptions import DotEnvError, DotEnvFileNotFoundError, ParseError, TypeConversionError
+from .helpers import getenv_typed, getenv_int, getenv_float, getenv_bool, getenv_str, setenv_typed, setenv_typed_many, patch_os_module, unpatch_os_module
 
 
 def get_version():
@@ -42,14 +42,30 @@ __version__ = get_version()
 __all__ = [
     "DotEnv",
     "load_env",
+    "load_env_from_string",
     "Env",
     "get_env",
     "set_env",
     "save_env",
     "DotEnvError",
-    "FileNotFoundError",
+    "DotEnvFileNotFoundError",
     "ParseError",
     "TypeConversionError",
     "show",
     "data"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # Deprecated alias, warned about here so the warning names this module
+    # and points at the caller's import
+    if name == 'FileNotFoundError':
+        import warnings
+        warnings.warn(
+            "envdot.FileNotFoundError is deprecated, "
+            "use DotEnvFileNotFoundError instead",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        return DotEnvFileNotFoundError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
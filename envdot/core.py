@@ -8,59 +8,110 @@
 
 """Core functionality for dot-env package with full TOML support"""
 
+import functools
+import io
+import math
 import os
 import sys
-import traceback
 import re
 import hashlib
+import importlib.util
 from fnmatch import fnmatch
 import json
-import configparser
+from collections import OrderedDict
 from pathlib3 import Path  # type: ignore
-from typing import Any, Dict, Optional, Union, List
-from .exceptions import FileNotFoundError, ParseError, TypeConversionError
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Union, List, Set, Tuple
+from .exceptions import DotEnvFileNotFoundError, ParseError, TypeConversionError
 import warnings
 
+if TYPE_CHECKING:
+    # Only needed for annotations; the INI paths import it when used
+    import configparser
+
 ENVDOT_CONFIGFILE = ""
 
-try:
-    import json5
-    HAS_JSON5 = True
-except ImportError:
-    HAS_JSON5 = False
+# Optional parser backends are imported on first use so that .env-only
+# users don't pay for them at import time. HAS_* only checks availability.
+HAS_JSON5 = importlib.util.find_spec('json5') is not None
+HAS_TOML = (importlib.util.find_spec('tomli') is not None
+            or importlib.util.find_spec('tomllib') is not None)
 
-try:
-    import tomli  # Python 3.11+ has tomllib built-in
-    HAS_TOML = True
-except ImportError:
-    try:
-        import tomllib as tomli  # Python 3.11+
-        HAS_TOML = True
-    except ImportError:
-        HAS_TOML = False
+_UNSET: Any = object()
+_json5_module: Any = _UNSET
+_toml_module: Any = _UNSET
+_yaml_module: Any = _UNSET
+_orjson_module: Any = _UNSET
+
+
+def _get_json5() -> Any:
+    """Return the json5 module, or None when it is not installed"""
+    global _json5_module
+    if _json5_module is _UNSET:
+        try:
+            import json5 as _json5_module
+        except ImportError:
+            _json5_module = None
+    return _json5_module
+
+
+def _get_orjson() -> Any:
+    """Return the orjson module (optional JSON accelerator), or None"""
+    global _orjson_module
+    if _orjson_module is _UNSET:
+        try:
+            import orjson as _orjson_module
+        except ImportError:
+            _orjson_module = None
+    return _orjson_module
+
+
+def _get_yaml() -> Any:
+    """Return the PyYAML module, or None when it is not installed"""
+    global _yaml_module
+    if _yaml_module is _UNSET:
+        try:
+            import yaml as _yaml_module
+        except ImportError:
+            _yaml_module = None
+    return _yaml_module
+
+
+def _get_toml() -> Any:
+    """Return tomli (or the Python 3.11+ tomllib), or None if neither exists"""
+    global _toml_module
+    if _toml_module is _UNSET:
+        try:
+            import tomli as _toml_module
+        except ImportError:
+            try:
+                import tomllib as _toml_module
+            except ImportError:
+                _toml_module = None
+    return _toml_module
 
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'CRITICAL')
 tprint = None  # type: ignore
 SHOW_LOGGING = False
+_TRUE_SET = frozenset(('1', 'true', 'ok', 'yes', 'on'))
 
-if (len(sys.argv) > 1 and any('--debug' == arg for arg in sys.argv)) or str(os.getenv('DOTENV_DEBUG', os.getenv('DEBUG', False))).lower() in ('1', 'true', 'ok', 'yes', 'on'):
+if '--debug' in sys.argv or os.environ.get('DOTENV_DEBUG', os.environ.get('DEBUG', '')).lower() in _TRUE_SET:
     print("🐞 Debug mode enabled")
     os.environ["DEBUG"] = "1"
     os.environ['LOGGING'] = "1"
-    os.environ.pop('NO_LOGGING', None)
     os.environ['TRACEBACK'] = "1"
-    os.environ["LOGGING"] = "1"
+    os.environ.pop('NO_LOGGING', None)
     LOG_LEVEL = "DEBUG"
     SHOW_LOGGING = True
     try:
         from pydebugger import debug  # type: ignore
     except Exception as e:
         print("For better experience, please install 'pydebugger' [still in the development stage] (pip)")
-        def debug(**kwargs):  # type: ignore
-            if kwargs:
-                for i in kwargs:
-                    if not i == 'debug':
-                        print(f"[DEBUG (envdot)] [1]: {i} = {kwargs.get(i)}")
+        def debug(*args, **kwargs):  # type: ignore
+            for arg in args:
+                print(f"[DEBUG (envdot)] [1]: {arg}")
+            for key, value in kwargs.items():
+                if key != 'debug':
+                    print(f"[DEBUG (envdot)] [1]: {key} = {value}")
 else:
     os.environ['NO_LOGGING'] = "1"
     def debug(*args, **kwargs):  # type: ignore
@@ -87,8 +138,143 @@ except:
 
 if not tprint:
     def tprint(*args, **kwargs):
+        import traceback
         traceback.print_exc(*args, **kwargs)
 
+# Patterns used on every call are compiled once at import
+_TRAILING_COMMA_OBJECT_RE = re.compile(r',\s*}')
+_TRAILING_COMMA_ARRAY_RE = re.compile(r',\s*]')
+# Integer literals too wide for orjson (which tops out at 64 bits)
+_LONG_DIGITS_RE = re.compile(r'[0-9]{20}')
+_LONG_DIGITS_BYTES_RE = re.compile(rb'[0-9]{20}')
+# A quoted .env value optionally followed by an inline comment:
+# KEY="a b"  # note
+_ENV_QUOTED_RE = re.compile(r'''(?P<quote>["'])(?P<val>.*?)(?P=quote)\s*(?:#.*)?$''')
+
+# Parsed (still untyped) file contents keyed on (absolute path, mtime_ns,
+# size), so reloading an unchanged file skips reading and parsing it again
+_PARSE_CACHE: 'OrderedDict[Tuple[str, int, int], Dict[str, Any]]' = OrderedDict()
+_PARSE_CACHE_SIZE = 64
+# Keys of _PARSE_CACHE entries already read from or handed to the disk cache
+_PERSISTED_KEYS: Set[Tuple[str, int, int]] = set()
+
+def _disk_cache_path(cache_key: Tuple[str, int, int]) -> str:
+    """Location of the on-disk copy of a parse cache entry"""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    # One file per source path: a newer parse replaces the old entry instead
+    # of piling up, and the stat fields stored inside reject stale reads
+    digest = hashlib.blake2b(cache_key[0].encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(cache_home, 'envdot', digest + '.json')
+
+def _read_disk_cache(cache_key: Tuple[str, int, int]) -> Optional[Dict[str, Any]]:
+    """Return the persisted parse result for cache_key, or None"""
+    try:
+        with open(_disk_cache_path(cache_key), 'rb') as f:
+            entry = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    
+    if not isinstance(entry, dict) or entry.get('key') != list(cache_key):
+        return None
+    return entry.get('data')
+
+def _write_disk_cache(cache_key: Tuple[str, int, int], data: Dict[str, Any]) -> None:
+    """Persist a parse result; failures only cost the next process a re-parse"""
+    path = _disk_cache_path(cache_key)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        # Entries hold parsed secrets, so keep them private to the user
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'key': list(cache_key), 'data': data}, f)
+        # Readers see either the previous file or the complete new one
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+# Spellings auto_detect maps to True/False/None (also the only bool spelling
+# tables for DotEnv.get(..., cast_type=bool) and helpers.getenv_bool)
+_BOOL_TRUE = frozenset(('true', 'yes', 'on', '1'))
+_BOOL_FALSE = frozenset(('false', 'no', 'off', '0'))
+_NONE_TOKENS = frozenset(('none', 'null', ''))
+# Leaf types JSON/YAML/TOML parsers produce that are stored without a
+# str() round trip (which would e.g. turn the number 1 into True)
+_NATIVE_SCALARS = frozenset((str, bool, int, float))
+# Non-numeric spellings float() still accepts
+_FLOAT_WORDS = frozenset(('inf', 'infinity', 'nan'))
+
+@functools.lru_cache(maxsize=4096)
+def _auto_detect_cached(value: str) -> Any:
+    """
+    String branch of TypeDetector.auto_detect(). Config files repeat the
+    same literals ('true', ports, ...) and every result is immutable, so
+    memoizing on the raw string is safe.
+    """
+    value = value.strip()
+    lowered = value.lower()
+    
+    if lowered in _NONE_TOKENS:
+        return None
+    
+    if lowered in _BOOL_TRUE:
+        return True
+    if lowered in _BOOL_FALSE:
+        return False
+    
+    # Only hand the value to int()/float() when it can actually be a
+    # number, so ordinary strings don't raise and catch a ValueError
+    digits = value[1:] if value[:1] in ('+', '-') else value
+    if digits.isdigit():
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    
+    head = digits[:1]
+    if head.isdigit() or head == '.' or digits.lower() in _FLOAT_WORDS:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    
+    return value
+
+def _cast_bool(value: Any) -> bool:
+    # auto_detect only ever produces exact builtin types, so compare the
+    # type directly instead of walking the MRO with isinstance()
+    value_type = type(value)
+    if value_type is bool:
+        # Identity test keeps the declared bool return type for mypy
+        return value is True
+    if value_type is str:
+        # Already-normalised spellings skip the strip()/lower() allocations
+        if value in _BOOL_TRUE:
+            return True
+        if value in _BOOL_FALSE:
+            return False
+        return value.strip().lower() in _BOOL_TRUE
+    return bool(value)
+
+def _cast_list(value: Any) -> List[str]:
+    # Treat commas as whitespace; str.split() drops the empty parts.
+    # str.replace() as a function raises TypeError for non-strings.
+    return str.replace(value, ',', ' ').split()
+
+def _cast_tuple(value: Any) -> Tuple[str, ...]:
+    return tuple(_cast_list(value))
+
+# cast_type -> converter shared by DotEnv.get() and helpers.getenv_typed();
+# any other type is called directly
+_CASTERS: Dict[type, Callable[[Any], Any]] = {
+    bool: _cast_bool,
+    list: _cast_list,
+    tuple: _cast_tuple,
+}
+
 class TypeDetector:
     """Automatic type detection and conversion"""
     
@@ -98,40 +284,24 @@ class TypeDetector:
         Automatically detect and convert string to appropriate type
         Supports: bool, int, float, None, and string
         """
+        # Non-strings are returned as-is (and may be unhashable)
         if not isinstance(value, str):
             return value
         
-        value = value.strip()
-        
-        if value.lower() in ('none', 'null', ''):
-            return None
-        
-        if value.lower() in ('true', 'yes', 'on', '1'):
-            return True
-        if value.lower() in ('false', 'no', 'off', '0'):
-            return False
-        
-        try:
-            if '.' not in value and 'e' not in value.lower() and str(value).isdigit():
-                return int(value)
-        except (ValueError, AttributeError):
-            pass
-        
-        try:
-            return float(value)
-        except (ValueError, AttributeError):
-            pass
-        
-        return value
+        return _auto_detect_cached(value)
     
     @staticmethod
     def to_string(value: Any) -> str:
         """Convert any value to string for storage"""
-        if value is None:
-            return ''
-        if isinstance(value, bool):
-            return 'true' if value else 'false'
-        return str(value)
+        # bool can't be subclassed, so an exact type lookup is enough
+        return _TO_STRING.get(type(value), str)(value)
+
+
+# Formatters for the types whose storage form differs from str(value)
+_TO_STRING: Dict[type, Callable[[Any], str]] = {
+    bool: lambda value: 'true' if value else 'false',
+    type(None): lambda value: '',
+}
 
 
 class FileHandler:
@@ -165,46 +335,93 @@ class FileHandler:
     @staticmethod
     def load_env_file(filepath: Path) -> Dict[str, str]:
         """Load .env file"""
-        env_vars = {}
+        # Read the whole file in one go; text mode has already normalised
+        # line endings to '\n'
         with open(filepath, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                
-                if not line or line.startswith('#'):
-                    continue
-                
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    if (value.startswith('"') and value.endswith('"')) or \
-                       (value.startswith("'") and value.endswith("'")):
-                        value = value[1:-1]
-                    
-                    env_vars[key] = value
+            content = f.read()
+        
+        return FileHandler.parse_env(content)
+    
+    @staticmethod
+    def parse_env(content: str) -> Dict[str, str]:
+        """Parse .env formatted text"""
+        env_vars = {}
+        for line_num, line in enumerate(content.split('\n'), 1):
+            line = line.strip()
+            
+            if not line or line.startswith('#'):
+                continue
+            
+            # One C-level scan for the separator instead of a test plus split
+            key, sep, value = line.partition('=')
+            if not sep:
+                raise ParseError(f"Invalid format at line {line_num}: {line}")
+            
+            key = key.strip()
+            # Accept shell-style "export KEY=value" lines
+            if key.startswith('export '):
+                key = key[7:].lstrip()
+            value = value.strip()
+            
+            quote = value[:1]
+            if quote == '"' or quote == "'":
+                if len(value) > 1 and value.endswith(quote):
+                    value = value[1:-1]
                 else:
-                    raise ParseError(f"Invalid format at line {line_num}: {line}")
+                    # Only quoted values can carry a trailing comment; an
+                    # unquoted '#' stays part of the value
+                    match = _ENV_QUOTED_RE.match(value)
+                    if match:
+                        value = match.group('val')
+            
+            env_vars[key] = value
         
         return env_vars
     
     @staticmethod
-    def load_json_file(filepath: Path) -> Dict[str, str]:
+    def load_json_file(filepath: Path) -> Dict[str, Any]:
         """Load .json file with fallback to JSON5"""
+        # Raw bytes: orjson and json.loads both decode UTF-8 themselves
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
+            with open(filepath, 'rb') as f:
                 content = f.read()
-            
+        except OSError as e:
+            raise ParseError(f"Invalid JSON format: {e}")
+        
+        return FileHandler.parse_json(content)
+    
+    @staticmethod
+    def parse_json(content: Union[str, bytes]) -> Dict[str, Any]:
+        """Parse JSON text (or UTF-8 bytes) with fallback to JSON5"""
+        try:
+            orjson = _get_orjson()
+            data = _UNSET
+            # orjson returns integers beyond 64 bits as lossy floats, so let
+            # the stdlib parser handle any document with a 20-digit run
+            if isinstance(content, bytes):
+                has_long_int = _LONG_DIGITS_BYTES_RE.search(content) is not None
+            else:
+                has_long_int = _LONG_DIGITS_RE.search(content) is not None
+            if orjson is not None and not has_long_int:
+                try:
+                    data = orjson.loads(content)
+                except ValueError:
+                    # Includes what orjson rejects but json accepts (NaN, ...)
+                    pass
             try:
-                data = json.loads(content)
+                if data is _UNSET:
+                    data = json.loads(content)
             except json.JSONDecodeError:
-                if HAS_JSON5:
+                if isinstance(content, bytes):
+                    content = content.decode('utf-8')
+                json5 = _get_json5()
+                if json5 is not None:
                     data = json5.loads(content)
                 else:
                     processed_content = FileHandler._fix_invalid_json(content)
                     data = json.loads(processed_content)
             
-            flattened = {}
+            flattened: Dict[str, Any] = {}
             FileHandler._flatten_dict(data, flattened)
             return flattened
         except Exception as e:
@@ -218,33 +435,39 @@ class FileHandler:
         content = content.replace("'", '"')
         content = content.replace('___ESCAPED_DOUBLE___', '\\"')
         content = content.replace('___ESCAPED_SINGLE___', "'")
-        content = re.sub(r',\s*}', '}', content)
-        content = re.sub(r',\s*]', ']', content)
+        content = _TRAILING_COMMA_OBJECT_RE.sub('}', content)
+        content = _TRAILING_COMMA_ARRAY_RE.sub(']', content)
         return content
 
     @staticmethod
-    def load_yaml_file(filepath: Path) -> Dict[str, str]:
+    def load_yaml_file(filepath: Path) -> Dict[str, Any]:
         """Load .yaml/.yml file"""
-        try:
-            import yaml
-        except ImportError:
+        # PyYAML reads and decodes a binary stream chunk by chunk itself
+        # (detecting UTF-8/UTF-16 from the BOM), so skip the text layer
+        with open(filepath, 'rb') as f:
+            return FileHandler.parse_yaml(f)
+    
+    @staticmethod
+    def parse_yaml(source: Any) -> Dict[str, Any]:
+        """Parse YAML from text or an open stream"""
+        yaml = _get_yaml()
+        if yaml is None:
             raise ImportError(
                 "PyYAML is required for YAML support. "
                 "Install it with: pip install pyyaml"
             )
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+            data = yaml.safe_load(source)
             
-            flattened = {}
+            flattened: Dict[str, Any] = {}
             FileHandler._flatten_dict(data, flattened)
             return flattened
         except yaml.YAMLError as e:
             raise ParseError(f"Invalid YAML format: {e}")
     
     @staticmethod
-    def load_ini_file(filepath: Path) -> Dict[str, str]:
+    def load_ini_file(filepath: Path, use_configparser: bool = False) -> Dict[str, str]:
         """
         Load .ini file with proper handling of sections and nested structure
         
@@ -253,31 +476,136 @@ class FileHandler:
         key = value
         
         Will be flattened to: SECTION_KEY = value
+        
+        Plain files are read with a small line parser; anything it doesn't
+        handle (continuation lines, duplicates, ...) or use_configparser=True
+        goes through configparser instead.
         """
-        config = configparser.ConfigParser()
+        if not use_configparser:
+            try:
+                content = Path(filepath).read_text(encoding='utf-8')
+            except OSError:
+                content = None
+            if content is not None:
+                env_vars = FileHandler._parse_ini_simple(content)
+                if env_vars is not None:
+                    return env_vars
+        
+        import configparser
+        # Values are kept raw: no %(name)s interpolation pass on every access
+        config = configparser.RawConfigParser(interpolation=None)
         try:
             config.read(filepath, encoding='utf-8')
         except configparser.Error as e:
             raise ParseError(f"Invalid INI format: {e}")
         
-        env_vars = {}
+        return FileHandler._ini_to_dict(config)
+    
+    @staticmethod
+    def parse_ini(content: str, use_configparser: bool = False) -> Dict[str, str]:
+        """Parse INI formatted text"""
+        if not use_configparser:
+            env_vars = FileHandler._parse_ini_simple(content)
+            if env_vars is not None:
+                return env_vars
+        
+        import configparser
+        config = configparser.RawConfigParser(interpolation=None)
+        try:
+            config.read_string(content)
+        except configparser.Error as e:
+            raise ParseError(f"Invalid INI format: {e}")
+        
+        return FileHandler._ini_to_dict(config)
+    
+    @staticmethod
+    def _parse_ini_simple(content: str) -> Optional[Dict[str, str]]:
+        """
+        Single-pass parser for flat INI files, producing the same result as
+        RawConfigParser(interpolation=None) + _ini_to_dict().
+        
+        Returns None for input it doesn't handle (indented/continuation
+        lines, keys outside a section, duplicate sections or keys, lines
+        without a delimiter) so the caller can defer to configparser, which
+        also takes care of reporting real errors.
+        """
+        defaults: Dict[str, str] = {}
+        sections: Dict[str, Dict[str, str]] = {}
+        current: Optional[Dict[str, str]] = None
+        seen_default = False
+        
+        for line in content.split('\n'):
+            stripped = line.strip()
+            if not stripped or stripped[0] in '#;':
+                continue
+            # Indented lines may be continuations; leave those to configparser
+            if line[0] != stripped[0]:
+                return None
+            
+            if stripped[0] == '[':
+                name = stripped[1:-1]
+                if stripped[-1] != ']' or not name or ']' in name:
+                    return None
+                if name == 'DEFAULT':
+                    if seen_default:
+                        return None
+                    seen_default = True
+                    current = defaults
+                elif name in sections:
+                    return None
+                else:
+                    current = sections[name] = {}
+                continue
+            
+            if current is None:
+                return None
+            
+            # configparser splits on whichever of '=' / ':' comes first
+            eq = stripped.find('=')
+            colon = stripped.find(':')
+            if eq < 0 or (0 <= colon < eq):
+                eq = colon
+            if eq < 0:
+                return None
+            key = stripped[:eq].rstrip().lower()
+            if not key or key in current:
+                return None
+            current[key] = stripped[eq + 1:].lstrip()
+        
+        env_vars: Dict[str, str] = {}
+        for name, options in sections.items():
+            section_prefix = name.upper()
+            merged = dict(defaults)
+            merged.update(options)
+            env_vars.update(
+                (f"{section_prefix}_{key.upper()}", value) for key, value in merged.items()
+            )
+        env_vars.update((key.upper(), value) for key, value in defaults.items())
+        return env_vars
+    
+    @staticmethod
+    def _ini_to_dict(config: 'configparser.RawConfigParser') -> Dict[str, str]:
+        """Flatten parsed INI sections to SECTION_KEY entries"""
+        env_vars: Dict[str, str] = {}
         
         # Process each section
         for section in config.sections():
-            for key, value in config.items(section):
-                # Create hierarchical key: SECTION_KEY
-                full_key = f"{section.upper()}_{key.upper()}"
-                env_vars[full_key] = value
+            # Create hierarchical key: SECTION_KEY
+            section_prefix = section.upper()
+            env_vars.update(
+                (f"{section_prefix}_{key.upper()}", value)
+                for key, value in config.items(section, raw=True)
+            )
         
         # Add DEFAULT section items without prefix (standard INI behavior)
-        if config.defaults():
-            for key, value in config.defaults().items():
-                env_vars[key.upper()] = value
+        defaults = config.defaults()
+        if defaults:
+            env_vars.update((key.upper(), value) for key, value in defaults.items())
         
         return env_vars
     
     @staticmethod
-    def load_toml_file(filepath: Path) -> Dict[str, str]:
+    def load_toml_file(filepath: Path) -> Dict[str, Any]:
         """
         Load .toml file with proper nested structure handling
         
@@ -296,7 +624,8 @@ class FileHandler:
         DATABASE_CREDENTIALS_USERNAME = admin
         DATABASE_CREDENTIALS_PASSWORD = secret
         """
-        if not HAS_TOML:
+        tomli = _get_toml()
+        if tomli is None:
             raise ImportError(
                 "tomli/tomllib is required for TOML support. "
                 "Install it with: pip install tomli (Python < 3.11)"
@@ -306,76 +635,143 @@ class FileHandler:
             with open(filepath, 'rb') as f:
                 data = tomli.load(f)
             
-            flattened = {}
+            flattened: Dict[str, Any] = {}
+            FileHandler._flatten_dict(data, flattened)
+            return flattened
+        except Exception as e:
+            raise ParseError(f"Invalid TOML format: {e}")
+    
+    @staticmethod
+    def parse_toml(content: str) -> Dict[str, Any]:
+        """Parse TOML formatted text"""
+        tomli = _get_toml()
+        if tomli is None:
+            raise ImportError(
+                "tomli/tomllib is required for TOML support. "
+                "Install it with: pip install tomli (Python < 3.11)"
+            )
+        
+        try:
+            data = tomli.loads(content)
+            
+            flattened: Dict[str, Any] = {}
             FileHandler._flatten_dict(data, flattened)
             return flattened
         except Exception as e:
             raise ParseError(f"Invalid TOML format: {e}")
     
     @staticmethod
-    def _flatten_dict(d: Any, result: Dict[str, str], prefix: str = '') -> None:
+    def loads(content: str, fmt: str = 'env') -> Dict[str, Any]:
+        """Parse in-memory text in the given format without touching disk"""
+        parsers = {
+            'env': FileHandler.parse_env,
+            'json': FileHandler.parse_json,
+            'yaml': FileHandler.parse_yaml,
+            'yml': FileHandler.parse_yaml,
+            'ini': FileHandler.parse_ini,
+            'toml': FileHandler.parse_toml,
+        }
+        parser = parsers.get(fmt.lower().lstrip('.'))
+        if not parser:
+            raise ParseError(f"Unsupported format: {fmt}")
+        return parser(content)
+    
+    @staticmethod
+    def _flatten_dict(d: Any, result: Dict[str, Any], prefix: str = '') -> None:
         """
-        Recursively flatten nested dictionaries and lists
+        Flatten nested dictionaries and lists
         
         Examples:
         {"db": {"host": "localhost"}} -> DB_HOST = localhost
         {"items": [1, 2, 3]} -> ITEMS_0 = 1, ITEMS_1 = 2, ITEMS_2 = 3
+        
+        Leaves the parser already typed (str, bool, int, float, None) are
+        kept as they are; anything else (dates, ...) is stored as str().
         """
-        if isinstance(d, dict):
-            for key, value in d.items():
-                new_key = f"{prefix}_{key}".upper() if prefix else key.upper()
-                if isinstance(value, (dict, list)):
-                    FileHandler._flatten_dict(value, result, new_key)
-                else:
-                    result[new_key] = str(value) if value is not None else ''
-        elif isinstance(d, list):
-            for i, item in enumerate(d):
-                new_key = f"{prefix}_{i}"
-                if isinstance(item, (dict, list)):
-                    FileHandler._flatten_dict(item, result, new_key)
-                else:
-                    result[new_key] = str(item) if item is not None else ''
-        else:
-            result[prefix] = str(d) if d is not None else ''
+        # Walk with an explicit stack of key parts and build each flat key
+        # once per leaf rather than concatenating a prefix at every level.
+        # Children are pushed in reverse so leaves come out in document order.
+        stack: List[Tuple[Tuple[str, ...], Any]] = [
+            ((prefix,) if prefix or isinstance(d, list) else (), d)
+        ]
+        while stack:
+            parts, node = stack.pop()
+            if isinstance(node, dict):
+                stack.extend(
+                    (parts + (str(key),), value)
+                    for key, value in reversed(list(node.items()))
+                )
+            elif isinstance(node, list):
+                stack.extend(
+                    (parts + (str(i),), item)
+                    for i, item in reversed(list(enumerate(node)))
+                )
+            else:
+                if node is not None and type(node) not in _NATIVE_SCALARS:
+                    node = str(node)
+                result['_'.join(parts).upper()] = node
     
     @staticmethod
     def save_env_file(filepath: Path, data: Dict[str, Any]) -> None:
         """Save to .env file"""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            for key, value in sorted(data.items()):
-                value_str = TypeDetector.to_string(value)
-                if ' ' in value_str or '#' in value_str:
-                    value_str = f'"{value_str}"'
-                f.write(f"{key}={value_str}\n")
+        # Build the whole file in memory, encode it once and hand the bytes
+        # over in a single write (no text-mode wrapper in between)
+        lines = []
+        for key, value in sorted(data.items()):
+            value_str = TypeDetector.to_string(value)
+            if ' ' in value_str or '#' in value_str:
+                value_str = f'"{value_str}"'
+            lines.append(f"{key}={value_str}\n")
+        
+        Path(filepath).write_bytes(''.join(lines).encode('utf-8'))
     
     @staticmethod
     def save_json_file(filepath: Path, data: Dict[str, Any]) -> None:
         """Save to .json file"""
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        orjson = _get_orjson()
+        # orjson writes NaN/inf as null, which would reload as None; the
+        # stdlib encoder keeps them as NaN/Infinity
+        non_finite = any(
+            type(value) is float and not math.isfinite(value) for value in data.values()
+        )
+        if orjson is not None and not non_finite:
+            try:
+                Path(filepath).write_bytes(
+                    orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                )
+                return
+            except TypeError:
+                # orjson.JSONEncodeError (a TypeError): e.g. ints wider than
+                # 64 bits; let the stdlib encoder handle those
+                pass
+        
+        # json.dump() issues many small writes; serialise first instead
+        content = json.dumps(data, indent=2, ensure_ascii=False)
+        Path(filepath).write_text(content, encoding='utf-8')
     
     @staticmethod
     def save_yaml_file(filepath: Path, data: Dict[str, Any]) -> None:
         """Save to .yaml file"""
-        try:
-            import yaml
-        except ImportError:
+        yaml = _get_yaml()
+        if yaml is None:
             raise ImportError(
                 "PyYAML is required for YAML support. "
                 "Install it with: pip install pyyaml"
             )
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            yaml.safe_dump(data, f, default_flow_style=False, allow_unicode=True)
+        content = yaml.safe_dump(data, default_flow_style=False, allow_unicode=True)
+        Path(filepath).write_text(content, encoding='utf-8')
     
     @staticmethod
     def save_ini_file(filepath: Path, data: Dict[str, Any]) -> None:
         """Save to .ini file"""
-        config = configparser.ConfigParser()
+        import configparser
+        config = configparser.RawConfigParser(interpolation=None)
         config['DEFAULT'] = {k: TypeDetector.to_string(v) for k, v in data.items()}
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            config.write(f)
+        buffer = io.StringIO()
+        config.write(buffer)
+        Path(filepath).write_text(buffer.getvalue(), encoding='utf-8')
     
     @staticmethod
     def save_toml_file(filepath: Path, data: Dict[str, Any]) -> None:
@@ -388,8 +784,7 @@ class FileHandler:
                 "Install it with: pip install tomli-w"
             )
         
-        with open(filepath, 'wb') as f:
-            tomli_w.dump(data, f)
+        Path(filepath).write_bytes(tomli_w.dumps(data).encode('utf-8'))
 
 
 # class DotEnvMeta(type):
@@ -463,11 +858,20 @@ class DotEnvMeta(type):
 class DotEnv(metaclass=DotEnvMeta):
     """Main class for managing environment variables from multiple file formats"""
     
-    def __init__(self, filepath: Optional[Union[str, Path]] = None, auto_load: bool = True, newone: bool = False):
+    # Fixed per-instance state lives in slots. '__dict__' stays available
+    # because other '_'-prefixed names and the metaclass's attribute
+    # forwarding may still set arbitrary instance attributes.
+    __slots__ = ('_data', '_filepath', '_format', '_persistent_cache', 'newone', 'hash', '__dict__')
+    
+    def __init__(self, filepath: Optional[Union[str, Path]] = None, auto_load: bool = True, newone: bool = False,
+                 persistent_cache: bool = False):
         global ENVDOT_CONFIGFILE
         self._data: Dict[str, Any] = {}
         self._filepath: Optional[Path] = None
         self._format: Optional[str] = None
+        # Also keep parse results under $XDG_CACHE_HOME/envdot so later
+        # processes can skip parsing an unchanged file
+        self._persistent_cache = persistent_cache
         # self.newone = newone
 
         object.__setattr__(self, 'newone', newone)
@@ -614,8 +1018,9 @@ class DotEnv(metaclass=DotEnvMeta):
     
     def load(self, filepath: Optional[Union[str, Path]] = None, 
          override: bool = True, apply_to_os: bool = True,
-         store_typed: bool = True, recursive: bool = True, newone: bool = False, os_overwrite: bool = False, **kwargs) -> 'DotEnv':
-        """Load environment variables from file"""
+         store_typed: bool = True, recursive: bool = True, newone: bool = False, os_overwrite: bool = False,
+         refresh: bool = False, **kwargs) -> 'DotEnv':
+        """Load environment variables from file (refresh=True skips the parse cache)"""
         debug(filepath = filepath)
         if filepath:
             self._filepath = Path(filepath)
@@ -639,9 +1044,13 @@ class DotEnv(metaclass=DotEnvMeta):
             with open(self._filepath, 'w') as f:  # type: ignore
                 f.write('')
         
-        if self._filepath and not self._filepath.exists():
+        if not self._filepath:
             return self
-        elif not self._filepath:
+        
+        # One stat() both checks existence and feeds the parse cache key
+        try:
+            st = os.stat(self._filepath)
+        except OSError:
             return self
         
         self._format = FileHandler.detect_format(self._filepath)
@@ -658,9 +1067,65 @@ class DotEnv(metaclass=DotEnvMeta):
         if not loader:
             raise ParseError(f"Unsupported file format: {self._format}")
         
-        raw_data = loader(self._filepath)
+        raw_data = self._load_cached(loader, self._filepath, st, self._persistent_cache, refresh)
         debug(raw_data = raw_data)
         
+        return self._apply_raw_data(raw_data, override, apply_to_os, os_overwrite)
+
+    @staticmethod
+    def _load_cached(loader, filepath: Path, st: os.stat_result,
+                     persistent: bool = False, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Run loader on filepath unless an unchanged copy was already parsed.
+        
+        The key is only (path, mtime_ns, size), which misses same-size edits
+        that keep the mtime; refresh=True re-parses and replaces the entry.
+        """
+        cache_key = (os.path.abspath(filepath), st.st_mtime_ns, st.st_size)
+        
+        raw_data = None
+        if not refresh:
+            try:
+                raw_data = _PARSE_CACHE[cache_key]
+                # Another thread may evict the entry in between; one
+                # try/except covers both steps without a lock
+                _PARSE_CACHE.move_to_end(cache_key)
+            except KeyError:
+                pass
+        
+        if raw_data is not None:
+            # The entry may come from an earlier non-persistent load, so
+            # write it through the first time a persistent load sees it
+            if persistent and cache_key not in _PERSISTED_KEYS:
+                _write_disk_cache(cache_key, raw_data)
+                _PERSISTED_KEYS.add(cache_key)
+            return raw_data
+        
+        raw_data = _read_disk_cache(cache_key) if persistent and not refresh else None
+        if raw_data is None:
+            raw_data = loader(filepath)
+            if persistent:
+                _write_disk_cache(cache_key, raw_data)
+        if persistent:
+            _PERSISTED_KEYS.add(cache_key)
+        
+        _PARSE_CACHE[cache_key] = raw_data
+        if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+            evicted, _ = _PARSE_CACHE.popitem(last=False)
+            _PERSISTED_KEYS.discard(evicted)
+        return raw_data
+
+    def load_string(self, content: str, fmt: str = 'env', override: bool = True,
+                    apply_to_os: bool = True, os_overwrite: bool = False) -> 'DotEnv':
+        """Load environment variables from in-memory text instead of a file"""
+        raw_data = FileHandler.loads(content, fmt)
+        debug(raw_data = raw_data)
+        
+        return self._apply_raw_data(raw_data, override, apply_to_os, os_overwrite)
+
+    def _apply_raw_data(self, raw_data: Dict[str, Any], override: bool,
+                        apply_to_os: bool, os_overwrite: bool) -> 'DotEnv':
+        """Type and store parsed values, optionally mirroring them into os.environ"""
         debug(apply_to_os = apply_to_os)
         debug(os_overwrite = os_overwrite)
 
@@ -669,15 +1134,26 @@ class DotEnv(metaclass=DotEnvMeta):
         
         # If override=True, delete keys that do not exist in the file
         if override:
-            keys_to_remove = []
-            for key in list(self._data.keys()):
-                if key.lower() not in INTERNAL_ATTRS and key not in raw_data:
-                    keys_to_remove.append(key)
+            keys_to_remove = [
+                key for key in self._data
+                if key not in raw_data and key.lower() not in INTERNAL_ATTRS
+            ]
             
             for key in keys_to_remove:
                 del self._data[key]
-                if apply_to_os and key in os.environ:
-                    del os.environ[key]
+                if apply_to_os:
+                    os.environ.pop(key, None)
+        
+        # Collect typed values and OS-side strings, then apply each in one go
+        typed = {}
+        os_updates = {}
+        
+        # Type every value once, here, so get() just returns stored values.
+        # Hoist the attribute lookups out of the per-key loop.
+        auto_detect = TypeDetector.auto_detect
+        to_string = TypeDetector.to_string
+        getenv = os.getenv
+        intern = sys.intern
         
         # Load/update data from file
         for key, value in raw_data.items():
@@ -685,14 +1161,24 @@ class DotEnv(metaclass=DotEnvMeta):
             if key.lower() in INTERNAL_ATTRS:
                 continue
             
-            typed_value = TypeDetector.auto_detect(value)
-            
-            if override or key not in self._data:
-                self._data[key] = typed_value
+            # Parsed keys are fresh strings; interning lets lookups with
+            # literal keys (already interned) match by identity
+            key = intern(key)
+            typed_value = auto_detect(value)
+            typed[key] = typed_value
 
             if apply_to_os:
-                if not os.getenv(key, False) or os_overwrite:
-                    os.environ[key] = TypeDetector.to_string(typed_value)
+                if not getenv(key, False) or os_overwrite:
+                    os_updates[key] = to_string(typed_value)
+
+        data = self._data
+        if override:
+            data.update(typed)
+        else:
+            data.update((key, value) for key, value in typed.items() if key not in data)
+
+        if os_updates:
+            os.environ.update(os_updates)
 
         return self
 
@@ -728,7 +1214,9 @@ class DotEnv(metaclass=DotEnvMeta):
         debug(reload = reload)
 
         if reload or not self.check_file(self._filepath):
-            self.load(self._filepath, apply_to_os=True)
+            # Explicit reloads and content-hash changes must not be answered
+            # from the stat-keyed parse cache
+            self.load(self._filepath, apply_to_os=True, refresh=True)
             new_hash = Path(self._filepath).hash()
             debug(new_hash = new_hash)
             object.__setattr__(self, 'hash', new_hash)
@@ -747,21 +1235,9 @@ class DotEnv(metaclass=DotEnvMeta):
             return default
         
         debug(cast_type = cast_type)
-        if cast_type:
+        if cast_type and type(value) is not cast_type:
             try:
-                if cast_type == bool:
-                    if isinstance(value, bool):
-                        return value
-                    if isinstance(value, str):
-                        return value.lower() in ('true', 'yes', 'on', '1')
-                    return bool(value)
-                elif cast_type == list:
-                    value = [i.strip() for i in re.split(r"[, ]+", value) if i]
-                    return value
-                elif cast_type == tuple:
-                    value = [i.strip() for i in re.split(r"[, ]+", value) if i]
-                    return tuple(value)
-                return cast_type(value)
+                return _CASTERS.get(cast_type, cast_type)(value)
             except (ValueError, TypeError) as e:
                 raise TypeConversionError(f"Cannot convert '{value}' to {cast_type.__name__}: {e}")
         debug(value = value)
@@ -772,6 +1248,8 @@ class DotEnv(metaclass=DotEnvMeta):
 
     def set(self, key: str, value: Any, apply_to_os: bool = True) -> 'DotEnv':
         """Set environment variable"""
+        if type(key) is str:
+            key = sys.intern(key)
         self._data[key] = value
         
         if apply_to_os:
@@ -818,11 +1296,10 @@ class DotEnv(metaclass=DotEnvMeta):
     
     def delete(self, key: str, remove_from_os: bool = True) -> 'DotEnv':
         """Delete environment variable"""
-        if key in self._data:
-            del self._data[key]
+        self._data.pop(key, None)
         
-        if remove_from_os and key in os.environ:
-            del os.environ[key]
+        if remove_from_os:
+            os.environ.pop(key, None)
         
         return self
     
@@ -832,6 +1309,31 @@ class DotEnv(metaclass=DotEnvMeta):
         data.update(self._data)
         return data
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a shallow copy of the loaded variables (no os.environ)"""
+        return dict(self._data)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'DotEnv':
+        """Build an instance from already-typed values without touching disk"""
+        instance = cls._in_memory()
+        instance._data.update(data)
+        return instance
+
+    @classmethod
+    def _in_memory(cls) -> 'DotEnv':
+        """Build an empty instance that is not backed by any file"""
+        # Bypass __init__ so no config file is searched for; get() must not
+        # reload a discovered one either
+        instance = cls.__new__(cls)
+        instance._data = {}
+        instance._filepath = None
+        instance._format = None
+        instance._persistent_cache = False
+        object.__setattr__(instance, 'newone', False)
+        object.__setattr__(instance, 'hash', '')
+        return instance
+
     def show(self, all = False):
         if all:
             return self.all()
@@ -850,9 +1352,8 @@ class DotEnv(metaclass=DotEnvMeta):
     def keys(self, all = False) -> list:
         """Get all variable names"""
         if all:
-            data = self.all()
-            return list(data.keys())
-        return list(self._data.keys())
+            return list(self.all())
+        return list(self._data)
     
     def clear(self, clear_os: bool = False) -> 'DotEnv':
         """Clear all stored variables"""
@@ -918,7 +1419,9 @@ class DotEnv(metaclass=DotEnvMeta):
         debug(reload = reload)
 
         if reload or not self.check_file(self._filepath):
-            self.load(self._filepath, apply_to_os=True)
+            # Explicit reloads and content-hash changes must not be answered
+            # from the stat-keyed parse cache
+            self.load(self._filepath, apply_to_os=True, refresh=True)
             new_hash = Path(self._filepath).hash()
             debug(new_hash = new_hash)
             object.__setattr__(self, 'hash', new_hash)
@@ -933,6 +1436,17 @@ class DotEnv(metaclass=DotEnvMeta):
         data = os.environ.copy()
         data.update(self._data)
 
+        # Compile a regex pattern once instead of per key
+        regex = None
+        if mode == 'regex' and pattern:
+            try:
+                regex = re.compile(
+                    pattern if case_sensitive else pattern_lower,
+                    0 if case_sensitive else re.IGNORECASE,
+                )
+            except re.error as e:
+                raise ValueError(f"Invalid regex pattern: {e}")
+
         # for key, value in self._data.items():
         for key, value in data.items():  # type: ignore
             match = False
@@ -948,11 +1462,7 @@ class DotEnv(metaclass=DotEnvMeta):
                 
             elif mode == 'regex':
                 # Regular expression matching
-                try:
-                    flags = 0 if case_sensitive else re.IGNORECASE
-                    match = bool(re.search(search_pattern, key, flags=flags))
-                except re.error as e:
-                    raise ValueError(f"Invalid regex pattern: {e}")
+                match = regex.search(key) is not None  # type: ignore
                     
             elif mode == 'contains':
                 # Substring matching
@@ -1060,11 +1570,13 @@ class DotEnv(metaclass=DotEnvMeta):
         
         # Filter by key pattern
         if key_pattern:
-            results = {k: v for k, v in results.items() 
-                      if k in self.find(key_pattern, mode=mode, **kwargs)}
+            # Run the key search once, not once per candidate key
+            matched = self.find(key_pattern, mode=mode, **kwargs)
+            results = {k: v for k, v in results.items() if k in matched}
         
         # Filter by value pattern
         if value_pattern:
+            value_regex = re.compile(value_pattern) if mode == 'regex' else None
             filtered = {}
             for key, value in results.items():
                 value_str = str(value) if value is not None else ''
@@ -1073,7 +1585,7 @@ class DotEnv(metaclass=DotEnvMeta):
                     if fnmatch(value_str, value_pattern):
                         filtered[key] = value
                 elif mode == 'regex':
-                    if re.search(value_pattern, value_str):
+                    if value_regex.search(value_str):  # type: ignore
                         filtered[key] = value
                 elif mode == 'contains':
                     if value_pattern in value_str:
@@ -1084,10 +1596,12 @@ class DotEnv(metaclass=DotEnvMeta):
         return results
 
     def __getattr__(self, name: str) -> Any:
-        if name in self._data:
-            return self._data[name]
-        elif name in os.environ:
-            return TypeDetector.auto_detect(os.environ[name])
+        value = self._data.get(name, _UNSET)
+        if value is not _UNSET:
+            return value
+        value = os.environ.get(name)
+        if value is not None:
+            return TypeDetector.auto_detect(value)
         raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
     
     # def __setattr__(self, name: str, value: Any) -> None:
@@ -1174,6 +1688,26 @@ def load_env(filepath: Optional[Union[str, Path]] = None,
     # _global_env.load(**kwargs)
     return _global_env
 
+def load_env_from_string(content: str, fmt: str = 'env',
+                         apply_to_os: bool = True,
+                         auto_replace_getenv: bool = True,
+                         patch_os: bool = True,
+                         **kwargs) -> DotEnv:
+    """Convenience function to load environment variables from in-memory text"""
+    global _global_env
+
+    if auto_replace_getenv:
+        from .helpers import replace_os_getenv
+        replace_os_getenv()
+    
+    if patch_os:
+        from .helpers import patch_os_module
+        patch_os_module()
+    
+    _global_env = DotEnv._in_memory()
+    _global_env.load_string(content, fmt, apply_to_os=apply_to_os, **kwargs)
+    return _global_env
+
 def Env(*args, **kwargs):
     return load_env(*args, **kwargs)
 
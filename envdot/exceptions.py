@@ -5,13 +5,15 @@
 # Description: Custom exceptions for envdot package 
 # License: MIT
 
+import warnings
+
 
 class DotEnvError(Exception):
     """Base exception for envdot errors"""
     pass
 
 
-class FileNotFoundError(DotEnvError):
+class DotEnvFileNotFoundError(DotEnvError):
     """Raised when the configuration file is not found"""
     pass
 
@@ -23,4 +25,17 @@ class ParseError(DotEnvError):
 
 class TypeConversionError(DotEnvError):
     """Raised when type conversion fails"""
-    pass
\ No newline at end of file
+    pass
+
+
+def __getattr__(name):
+    # Deprecated alias: the old name shadowed the built-in FileNotFoundError
+    if name == 'FileNotFoundError':
+        warnings.warn(
+            "envdot.exceptions.FileNotFoundError is deprecated, "
+            "use DotEnvFileNotFoundError instead",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        return DotEnvFileNotFoundError
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
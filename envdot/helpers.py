@@ -9,69 +9,51 @@
 """Helper functions for enhanced environment variable access"""
 
 import os
-import re
-import fnmatch
-from typing import Any, Optional, TypeVar, Union, List, Dict
-from .core import TypeDetector
-import traceback
+import functools
+import logging
+import string
+from typing import Any, Callable, Optional, TypeVar, Union, List, Dict
+# Reuse the logger core.py already configured instead of importing and
+# setting up richcolorlog/custom_logging a second time.
+from .core import TypeDetector, logger, _CASTERS
+from .core import set_env, save_env, find_env, filter_env, search_env
 import sys
 
-LOG_LEVEL = os.getenv('LOG_LEVEL', 'CRITICAL')
-tprint = None  # type: ignore
-SHOW_LOGGING = False
+_TRUE_SET = frozenset(('1', 'true', 'ok', 'yes', 'on'))
 
-if (len(sys.argv) > 1 and any('--debug' == arg for arg in sys.argv)) or str(os.getenv('DOTENV_DEBUG', os.getenv('DEBUG', False))).lower() in ('1', 'true', 'ok', 'yes', 'on'):
+if '--debug' in sys.argv or os.environ.get('DOTENV_DEBUG', os.environ.get('DEBUG', '')).lower() in _TRUE_SET:
     print("🐞 Debug mode enabled")
     os.environ["DEBUG"] = "1"
     os.environ['LOGGING'] = "1"
-    os.environ.pop('NO_LOGGING', None)
     os.environ['TRACEBACK'] = "1"
-    os.environ["LOGGING"] = "1"
-    LOG_LEVEL = "DEBUG"
-    SHOW_LOGGING = True
+    os.environ.pop('NO_LOGGING', None)
     try:
         from pydebugger import debug  # type: ignore
     except Exception as e:
         print("For better experience, please install 'pydebugger' [still in the development stage] (pip)")
-        def debug(**kwargs):  # type: ignore
-            if kwargs:
-                for i in kwargs:
-                    if not i == 'debug':
-                        print(f"[DEBUG (envdot)] [1]: {i} = {kwargs.get(i)}")
+        def debug(*args, **kwargs):  # type: ignore
+            for arg in args:
+                print(f"[DEBUG (envdot)] [1]: {arg}")
+            for key, value in kwargs.items():
+                if key != 'debug':
+                    print(f"[DEBUG (envdot)] [1]: {key} = {value}")
 else:
     os.environ['NO_LOGGING'] = "1"
     def debug(*args, **kwargs):  # type: ignore
         pass
 
-try:
-    from richcolorlog import setup_logging, print_exception as tprint  # type: ignore
-    logger = setup_logging(
-        name="envdot",
-        level=LOG_LEVEL,
-        show=SHOW_LOGGING
-    )
-    HAS_RICHCOLORLOG=True
-except:
-    HAS_RICHCOLORLOG=False
-    import logging
-
-    try:
-        from .custom_logging import get_logger  # type: ignore
-    except ImportError:
-        from custom_logging import get_logger  # type: ignore
-    
-    logger = get_logger('envdot', level=getattr(logging, LOG_LEVEL.upper(), logging.CRITICAL))
+T = TypeVar('T')
 
-if not tprint:
-    def tprint(*args, **kwargs):
-        traceback.print_exc(*args, **kwargs)
+# auto_detect is a staticmethod, so this is the plain function
+_auto_detect = TypeDetector.auto_detect
 
-
-T = TypeVar('T')
+# cast_type values whose results are immutable and therefore safe to memoize
+_CACHED_CASTS = frozenset((None, bool, int, float, str, tuple))
 
 # Save original os.getenv IMMEDIATELY when module loads
-_original_getenv = os.getenv if not hasattr(os, '_env_dot_original_getenv') else os._env_dot_original_getenv
-os._env_dot_original_getenv = _original_getenv
+_original_getenv: Callable[..., Optional[str]] = getattr(os, '_env_dot_original_getenv', os.getenv)
+os._env_dot_original_getenv = _original_getenv  # type: ignore
+_ORIG_GETENV = _original_getenv
 
 
 def getenv_typed(key: str, default: Any = None, cast_type: Optional[type] = None) -> Any:
@@ -100,39 +82,104 @@ def getenv_typed(key: str, default: Any = None, cast_type: Optional[type] = None
     """
     # ALWAYS use the saved original, never os.getenv
 
-    value = os._env_dot_original_getenv(key)  # type: ignore
-    logger.debug(f"key: {key}")  # type: ignore
-    logger.debug(f"value: {value}")  # type: ignore
-    
+    value = _ORIG_GETENV(key)
     if value is None:
         return default
+    # Environment values are already strings; no detection needed
+    if cast_type is str:
+        return value
     
-    # Auto-detect type
-    typed_value = TypeDetector.auto_detect(value)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("key: %s, value: %s", key, value)
     
-    # Apply explicit type casting if requested
-    if cast_type:
+    # Results for immutable types are memoized on the raw string, so they
+    # can never go stale; anything else is converted fresh on every call.
+    convert = _convert if cast_type in _CACHED_CASTS else _convert.__wrapped__
+    try:
+        return convert(value, cast_type)
+    except (ValueError, TypeError):
+        # If casting fails, return default or original value
+        return default if default is not None else _convert(value, None)
+
+
+def _fast_digits(raw: str) -> Any:
+    """Plain ASCII digit strings: '0'/'1' are booleans, anything else an int"""
+    if raw.isdigit() and raw.isascii():
+        if raw == '1':
+            return True
+        if raw == '0':
+            return False
         try:
-            if cast_type == bool:
-                if isinstance(typed_value, bool):
-                    return typed_value
-                if isinstance(typed_value, str):
-                    return typed_value.lower() in ('true', 'yes', 'on', '1')
-
-                return bool(typed_value)
-            elif cast_type == list:
-                value = [i.strip() for i in re.split(",| ", value, re.I) if i]
-                return value
-            elif cast_type == tuple:
-                value = [i.strip() for i in re.split(",| ", value, re.I) if i]
-                return tuple(typed_value)
-
-            return cast_type(typed_value)
-        except (ValueError, TypeError):
-            # If casting fails, return default or original value
-            return default if default is not None else typed_value
+            return int(raw)
+        except ValueError:
+            # Past the int max-digits limit; auto_detect falls back to float
+            pass
+    return _auto_detect(raw)
+
+
+_WORD_TRUE = frozenset(('true', 'yes', 'on'))
+_WORD_FALSE = frozenset(('false', 'no', 'off'))
+
+
+def _fast_word(raw: str) -> Any:
+    """
+    Letter-initial values other than none/null/nan/inf: either a boolean
+    word (any case) or a plain string, never a number
+    """
+    # The first character is not whitespace, so rstrip() == strip() here
+    stripped = raw.rstrip()
+    lowered = stripped.lower()
+    if lowered in _WORD_TRUE:
+        return True
+    if lowered in _WORD_FALSE:
+        return False
+    return stripped
+
+
+def _fast_plain(raw: str) -> Any:
+    """Values starting with a quote or other punctuation are never bool, None or numeric"""
+    return raw.strip()
+
+
+_FAST_DISPATCH: Dict[str, Callable[[str], Any]] = dict.fromkeys('0123456789', _fast_digits)
+# 'n'/'i' can still spell none/null/nan/inf, so those go the generic route
+_FAST_DISPATCH.update((c, _fast_word) for c in string.ascii_letters if c not in 'nNiI')
+# float() accepts a leading sign or '.', everything else here rules out a number
+_FAST_DISPATCH.update((c, _fast_plain) for c in string.punctuation if c not in '+-.')
+
+
+def _fast_typed(raw: str) -> Any:
+    """
+    Same result as TypeDetector.auto_detect(), but picks a specialised
+    converter from the first character so the common shapes (digits,
+    words, quoted strings) skip the generic detection chain and the
+    ValueError that float() raises for non-numeric text
+    """
+    handler = _FAST_DISPATCH.get(raw[:1])
+    if handler is None:
+        return _auto_detect(raw)
+    return handler(raw)
+
+
+# list/tuple split the raw text, since detection may have made it a number
+_SPLIT_CASTS = frozenset((list, tuple))
+
+
+@functools.lru_cache(maxsize=1024)
+def _convert(raw: str, cast_type: Optional[type] = None) -> Any:
+    """Detect the type of a raw environment string and apply cast_type"""
+    # Auto-detect type
+    typed_value = _fast_typed(raw)
+    
+    # Apply explicit type casting if requested; detection frequently
+    # already produced the requested type (e.g. int for getenv_int)
+    if not cast_type or type(typed_value) is cast_type:
+        return typed_value
     
-    return typed_value
+    caster = _CASTERS.get(cast_type)
+    if caster is not None:
+        return caster(raw if cast_type in _SPLIT_CASTS else typed_value)
+    return cast_type(typed_value)
 
 
 def setenv_typed(key: str, value: Any) -> None:
@@ -153,27 +200,62 @@ def setenv_typed(key: str, value: Any) -> None:
     os.environ[key] = TypeDetector.to_string(value)
 
 
+def setenv_typed_many(mapping: Dict[str, Any]) -> None:
+    """
+    Set several environment variables at once, converting each value
+    the same way as setenv_typed()
+    
+    Args:
+        mapping: Dictionary of variable names to values
+        
+    Examples:
+        >>> setenv_typed_many({'PORT': 8080, 'DEBUG': True})
+        >>> os.getenv('DEBUG')  # Returns: 'true'
+    """
+    to_string = TypeDetector.to_string
+    os.environ.update({key: to_string(value) for key, value in mapping.items()})
+
+
 def getenv_int(key: str, default: int = 0) -> int:
     """Get environment variable as integer"""
-    return getenv_typed(key, default=default, cast_type=int)
+    return getenv_typed(key, default, int)
 
 
 def getenv_float(key: str, default: float = 0.0) -> float:
     """Get environment variable as float"""
-    return getenv_typed(key, default=default, cast_type=float)
+    return getenv_typed(key, default, float)
 
 
 def getenv_bool(key: str, default: bool = False) -> bool:
     """Get environment variable as boolean"""
-    return getenv_typed(key, default=default, cast_type=bool)
+    return getenv_typed(key, default, bool)
 
 
 def getenv_str(key: str, default: str = '') -> str:
     """Get environment variable as string"""
-    return getenv_typed(key, default=default, cast_type=str)
+    return getenv_typed(key, default, str)
+
+# Attributes installed on the os module by patch_os_module(). The core
+# functions already have the signatures we want to expose, so they are
+# bound directly instead of being wrapped in lambdas.
+_OS_PATCHES = {
+    'getenv_typed': getenv_typed,
+    'getenv_int': getenv_int,
+    'getenv_float': getenv_float,
+    'getenv_bool': getenv_bool,
+    'getenv_str': getenv_str,
+    'setenv_typed': setenv_typed,
+    'setenv_many': setenv_typed_many,
+    'setenv': set_env,
+    'save_env': save_env,
+    'find': find_env,
+    'filter': filter_env,
+    'search': search_env,
+}
+
 
 # Monkey-patch os module for convenience (optional usage)
-def patch_os_module():
+def patch_os_module() -> None:
     """
     Monkey-patch os module to add typed getenv functions and save_env
     
@@ -182,9 +264,14 @@ def patch_os_module():
         - os.getenv_int()
         - os.getenv_float()
         - os.getenv_bool()
+        - os.getenv_str()
         - os.setenv_typed()
+        - os.setenv_many()
         - os.save_env()
         - os.setenv()
+        - os.find() / os.filter() / os.search()
+    
+    Calling it again is a no-op until unpatch_os_module() is called.
     
     Example:
         >>> from dotenv.helpers import patch_os_module
@@ -192,24 +279,25 @@ def patch_os_module():
         >>> os.getenv_typed('PORT')  # Auto-typed
         >>> os.save_env()  # Save to file
     """
-    # Import here to avoid circular import
-    import envdot.core as core_module
+    if getattr(os, '_envdot_patched', False):
+        return
     
-    os.getenv_typed = getenv_typed  # type: ignore
-    os.getenv_int = getenv_int  # type: ignore
-    os.getenv_float = getenv_float  # type: ignore
-    os.getenv_bool = getenv_bool  # type: ignore
-    os.getenv_str = getenv_str  # type: ignore
-    os.setenv_typed = setenv_typed  # type: ignore
-    # def set_env(key: str, value: Any, **kwargs) -> DotEnv:
-    os.setenv = lambda key, value, **kwargs: core_module.set_env(key, value, **kwargs)  # type: ignore
-    os.save_env = lambda filepath=None, **kwargs: core_module.save_env(filepath, **kwargs)  # type: ignore
-    os.find = lambda *args, **kwargs: core_module.find_env(*args, **kwargs)  # type: ignore
-    os.filter = lambda *args, **kwargs: core_module.filter_env(*args, **kwargs)  # type: ignore
-    os.search = lambda *args, **kwargs: core_module.search_env(*args, **kwargs)  # type: ignore
-
-
-def replace_os_getenv():
+    for name, func in _OS_PATCHES.items():
+        setattr(os, name, func)
+    os._envdot_patched = True  # type: ignore
+
+
+def unpatch_os_module() -> None:
+    """
+    Remove the attributes added by patch_os_module()
+    """
+    for name in _OS_PATCHES:
+        if hasattr(os, name):
+            delattr(os, name)
+    os._envdot_patched = False  # type: ignore
+
+
+def replace_os_getenv() -> None:
     """
     REPLACE os.getenv() to return auto-typed values!
     
@@ -230,8 +318,8 @@ def replace_os_getenv():
     os.getenv = getenv_typed
 
 
-def restore_os_getenv():
+def restore_os_getenv() -> None:
     """
     Restore original os.getenv() behavior
     """
-    os.getenv = os._env_dot_original_getenv  # type: ignore
\ No newline at end of file
+    os.getenv = _ORIG_GETENV  # type: ignore
\ No newline at end of file
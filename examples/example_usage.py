@@ -6,7 +6,7 @@ Complete examples for using envdot with all supported formats
 
 import os
 from pathlib import Path
-from envdot import load_env, get_env, set_env, save_env, DotEnv
+from envdot import load_env, load_env_from_string, get_env, set_env, save_env, DotEnv
 
 # ============================================================================
 # EXAMPLE 1: Using .env file (Most Common)
@@ -18,7 +18,7 @@ def example_dotenv():
     print("EXAMPLE 1: .env File")
     print("="*70)
     
-    # Create sample .env file
+    # Sample .env content
     env_content = """
 # Database Configuration
 DATABASE_HOST=localhost
@@ -37,10 +37,8 @@ ENABLE_CACHE=true
 ENABLE_AUTH=false
 """
     
-    Path('.env.example').write_text(env_content)
-    
-    # Load .env file
-    env = load_env('.env.example')
+    # Load the .env content straight from memory
+    env = load_env_from_string(env_content)
     
     # Access values (auto-typed!)
     print(f"Database Host: {get_env('DATABASE_HOST')}")  # str
@@ -53,7 +51,7 @@ ENABLE_AUTH=false
     set_env('NEW_FEATURE', 'enabled')
     save_env('.env.example')
     
-    print("\n✅ .env file loaded and modified successfully!")
+    print("\n✅ .env content loaded, modified and saved successfully!")
 
 
 # ============================================================================
@@ -66,7 +64,7 @@ def example_json():
     print("EXAMPLE 2: JSON File")
     print("="*70)
     
-    # Create sample JSON file
+    # Sample JSON content
     json_content = """{
   "database": {
     "host": "localhost",
@@ -84,10 +82,8 @@ def example_json():
   "features": ["auth", "cache", "logging"]
 }"""
     
-    Path('config.json').write_text(json_content)
-    
-    # Load JSON file
-    env = load_env('config.json')
+    # Load the JSON content straight from memory
+    env = load_env_from_string(json_content, 'json')
     
     # Access flattened nested keys
     print(f"Database Host: {get_env('DATABASE_HOST')}")
@@ -106,7 +102,7 @@ def example_json():
     for key in env.keys():
         print(f"  {key} = {get_env(key)}")
     
-    print("\n✅ JSON file loaded successfully!")
+    print("\n✅ JSON content loaded successfully!")
 
 
 # ============================================================================
@@ -119,7 +115,7 @@ def example_yaml():
     print("EXAMPLE 3: YAML File")
     print("="*70)
     
-    # Create sample YAML file
+    # Sample YAML content
     yaml_content = """
 # Application Configuration
 database:
@@ -148,11 +144,9 @@ features:
   - logging
 """
     
-    Path('config.yaml').write_text(yaml_content)
-    
     try:
-        # Load YAML file
-        env = load_env('config.yaml')
+        # Load the YAML content straight from memory
+        env = load_env_from_string(yaml_content, 'yaml')
         
         # Access nested values
         print(f"Database Host: {get_env('DATABASE_HOST')}")
@@ -163,7 +157,7 @@ features:
         # Array access
         print(f"Features: {get_env('FEATURES_0')}, {get_env('FEATURES_1')}, {get_env('FEATURES_2')}")
         
-        print("\n✅ YAML file loaded successfully!")
+        print("\n✅ YAML content loaded successfully!")
     except ImportError:
         print("\n⚠️  PyYAML not installed. Install with: pip install pyyaml")
 
@@ -178,7 +172,7 @@ def example_ini():
     print("EXAMPLE 4: INI File")
     print("="*70)
     
-    # Create sample INI file
+    # Sample INI content
     ini_content = """[DEFAULT]
 app_name = My Application
 version = 1.0.0
@@ -200,10 +194,8 @@ ttl = 3600
 type = redis
 """
     
-    Path('config.ini').write_text(ini_content)
-    
-    # Load INI file
-    env = load_env('config.ini')
+    # Load the INI content straight from memory
+    env = load_env_from_string(ini_content, 'ini')
     
     # Access with section prefixes
     print(f"App Name: {get_env('APP_NAME')}")  # From DEFAULT
@@ -215,7 +207,7 @@ type = redis
     print(f"Cache Enabled: {get_env('CACHE_ENABLED')}")     # From [cache]
     print(f"Cache TTL: {get_env('CACHE_TTL')}")             # From [cache]
     
-    print("\n✅ INI file loaded successfully!")
+    print("\n✅ INI content loaded successfully!")
 
 
 # ============================================================================
@@ -228,7 +220,7 @@ def example_toml():
     print("EXAMPLE 5: TOML File (Recommended!)")
     print("="*70)
     
-    # Create sample TOML file
+    # Sample TOML content
     toml_content = """# Application Configuration
 title = "My Application"
 version = "1.0.0"
@@ -270,11 +262,9 @@ console = true
 file = "app.log"
 """
     
-    Path('config.toml').write_text(toml_content)
-    
     try:
-        # Load TOML file
-        env = load_env('config.toml')
+        # Load the TOML content straight from memory
+        env = load_env_from_string(toml_content, 'toml')
         
         # Access root level
         print(f"Title: {get_env('TITLE')}")
@@ -299,7 +289,7 @@ file = "app.log"
         # Deep nesting
         print(f"Logging: {get_env('LOGGING_LEVEL')} -> {get_env('LOGGING_HANDLERS_FILE')}")
         
-        print("\n✅ TOML file loaded successfully!")
+        print("\n✅ TOML content loaded successfully!")
     except ImportError as e:
         print(f"\n⚠️  TOML support not available: {e}")
         print("Install with: pip install tomli tomli-w (Python < 3.11)")
@@ -374,8 +364,7 @@ RATIO=0.75
 ALLOWED_HOSTS=localhost, 127.0.0.1, example.com
 MAX_RETRIES=5
 """
-    Path('.env.types').write_text(env_content)
-    env = load_env('.env.types')
+    env = load_env_from_string(env_content)
     
     # Auto-detected types
     print("Auto-detected types:")
@@ -413,8 +402,7 @@ API_PORT=9000
 API_DEBUG=true
 API_TIMEOUT=5.5
 """
-    Path('.env.api').write_text(env_content)
-    env = load_env('.env.api', auto_replace_getenv=True)
+    env = load_env_from_string(env_content, auto_replace_getenv=True)
     
     # Now os.getenv() returns typed values!
     import os
@@ -526,6 +514,20 @@ ENABLE_MONITORING=true
 # Main Function - Run All Examples
 # ============================================================================
 
+# Examples in the order main() runs them
+_EXAMPLES = (
+    ("Basic .env File", example_dotenv),
+    ("JSON File with Nesting", example_json),
+    ("YAML File", example_yaml),
+    ("INI File with Sections", example_ini),
+    ("TOML File (Recommended)", example_toml),
+    ("Format Conversion", example_format_conversion),
+    ("Type Casting", example_type_casting),
+    ("Auto-typed os.getenv()", example_os_getenv_typed),
+    ("Attribute-style Access", example_attribute_access),
+    ("Production Setup", example_production_setup),
+)
+
 def main():
     """Run all examples"""
     print("\n" + "="*70)
@@ -533,20 +535,7 @@ def main():
     print("Multi-format Configuration Management (.env, JSON, YAML, INI, TOML)")
     print("="*70)
     
-    examples = [
-        ("Basic .env File", example_dotenv),
-        ("JSON File with Nesting", example_json),
-        ("YAML File", example_yaml),
-        ("INI File with Sections", example_ini),
-        ("TOML File (Recommended)", example_toml),
-        ("Format Conversion", example_format_conversion),
-        ("Type Casting", example_type_casting),
-        ("Auto-typed os.getenv()", example_os_getenv_typed),
-        ("Attribute-style Access", example_attribute_access),
-        ("Production Setup", example_production_setup),
-    ]
-    
-    for title, example_func in examples:
+    for title, example_func in _EXAMPLES:
         try:
             example_func()
         except Exception as e:
@@ -557,17 +546,20 @@ def main():
     # Cleanup
     print("\n" + "="*70)
     print("Cleaning up example files...")
-    cleanup_files = [
-        '.env.example', 'config.json', 'config.yaml', 'config.ini', 'config.toml',
-        'source.json', 'converted.env', 'converted.yaml', 'converted.ini', 'converted.toml',
-        '.env.types', '.env.api', '.env.server', 'config.base.ini', 'config.prod.env'
-    ]
-    
-    for file in cleanup_files:
-        try:
-            Path(file).unlink(missing_ok=True)
-        except:
-            pass
+    cleanup_files = frozenset((
+        '.env.example', 'source.json',
+        'converted.env', 'converted.yaml', 'converted.ini', 'converted.toml',
+        '.env.server', 'config.base.ini', 'config.prod.env'
+    ))
+    
+    # One directory scan; only files that actually exist get unlinked
+    with os.scandir('.') as entries:
+        for entry in entries:
+            if entry.name in cleanup_files:
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
     
     print("✅ Cleanup completed!")
     print("\n" + "="*70)
@@ -399,12 +399,12 @@ def example_save_and_load():
     env.save('output.json')
     print("Saved to output.env and output.json")
     
-    # Load from saved file
-    env2 = DotEnv('output.json')
-    print(f"Loaded {len(env2.all())} variables from output.json")
+    # Round-trip in memory; no need to read the file back
+    env2 = DotEnv.from_dict(env.to_dict())
+    print(f"Copied {len(env2.to_dict())} variables")
     
-    # Display loaded values
-    for key, value in env2.all().items():
+    # Display copied values
+    for key, value in env2.to_dict().items():
         print(f"  {key} = {value} ({type(value).__name__})")
     print()
 
@@ -430,13 +430,13 @@ def example_error_handling():
     """Error handling examples"""
     print("=== Error Handling ===")
     
-    from envdot import FileNotFoundError, ParseError, TypeConversionError
+    from envdot import DotEnvFileNotFoundError, ParseError, TypeConversionError
     
     try:
         env = DotEnv('nonexistent.env')
         env.load()
-    except FileNotFoundError as e:
-        print(f"Caught FileNotFoundError: {e}")
+    except DotEnvFileNotFoundError as e:
+        print(f"Caught DotEnvFileNotFoundError: {e}")
     
     try:
         env = DotEnv('.env')
@@ -582,32 +582,32 @@ def example_find():
     print("\n16. Get as list of tuples: env.find('API_*', return_dict=False)")
     print(env.find('API_*', return_dict=False))
 
+# Examples in the order main() runs them
+_EXAMPLES = (
+    example_helpers_basic,
+    example_convenience_functions,
+    example_multiple_formats,
+    example_type_casting,
+    example_method_chaining,
+    example_dictionary_access,
+    example_nested_json_yaml,
+    example_default_values,
+    example_os_environ_integration,
+    example_save_and_load,
+    example_clear_and_delete,
+    example_error_handling,
+    example_real_world_app,
+    example_find,
+)
+
 def main():
     print("DOT-ENV Package Examples\n")
     
-    # Run all examples
-    examples = [
-        example_helpers_basic,
-        example_convenience_functions,
-        example_multiple_formats,
-        example_type_casting,
-        example_method_chaining,
-        example_dictionary_access,
-        example_nested_json_yaml,
-        example_default_values,
-        example_os_environ_integration,
-        example_save_and_load,
-        example_clear_and_delete,
-        example_error_handling,
-        example_real_world_app,
-        example_find,
-    ]
-    
     if len(sys.argv) == 1:
         # Display menu
         print("Available examples:")
         print("-" * 60)
-        for n, example_func in enumerate(examples, 1):
+        for n, example_func in enumerate(_EXAMPLES, 1):
             # Extract function name and format it nicely
             func_name = example_func.__name__
             if func_name.startswith('example_'):
@@ -625,7 +625,7 @@ def main():
             print("\n" + "=" * 60)
             print("RUNNING ALL EXAMPLES")
             print("=" * 60 + "\n")
-            for example in examples:
+            for example in _EXAMPLES:
                 try:
                     print(f"\n>>> Running: {example.__name__}")
                     print("-" * 60)
@@ -634,9 +634,9 @@ def main():
                 except Exception as e:
                     print(f"❌ Example {example.__name__} failed: {e}\n")
         
-        elif q.isdigit() and 1 <= int(q) <= len(examples):
+        elif q.isdigit() and 1 <= int(q) <= len(_EXAMPLES):
             # Run selected example
-            selected = examples[int(q) - 1]
+            selected = _EXAMPLES[int(q) - 1]
             print(f"\n>>> Running: {selected.__name__}")
             print("=" * 60 + "\n")
             try:
@@ -644,13 +644,13 @@ def main():
             except Exception as e:
                 print(f"❌ Example failed: {e}")
         else:
-            print(f"❌ Invalid selection. Please choose a number between 1 and {len(examples)}")
+            print(f"❌ Invalid selection. Please choose a number between 1 and {len(_EXAMPLES)}")
     
     elif any(arg in sys.argv[1:] for arg in ['-a', '-all', '--all']):
         # Run all examples via command line
         print("Running all examples...\n")
         print("=" * 60 + "\n")
-        for example in examples:
+        for example in _EXAMPLES:
             try:
                 print(f"\n>>> Running: {example.__name__}")
                 print("-" * 60)
@@ -664,7 +664,7 @@ def main():
         example_name = sys.argv[1].lower()
         found = False
         
-        for example in examples:
+        for example in _EXAMPLES:
             if example.__name__.lower().endswith(example_name):
                 print(f"\n>>> Running: {example.__name__}")
                 print("=" * 60 + "\n")
@@ -678,7 +678,7 @@ def main():
         if not found:
             print(f"❌ Example '{example_name}' not found.")
             print("\nAvailable examples:")
-            for n, example_func in enumerate(examples, 1):
+            for n, example_func in enumerate(_EXAMPLES, 1):
                 print(f"  {n}. {example_func.__name__}")
 
 if __name__ == '__main__':
@@ -65,6 +65,7 @@ full = [
     "tomli>=2.0.1;python_version<'3.11'",
     "tomli-w>=1.0.0",
     "json5>=0.9.14",
+    "orjson>=3.8.0",
     "richcolorlog>=0.1.0"
 ]
 yaml = ["pyyaml>=6.0.1"]
@@ -73,6 +74,7 @@ toml = [
     "tomli-w>=1.0.0"
 ]
 json5 = ["json5>=0.9.14"]
+orjson = ["orjson>=3.8.0"]
 rich = ["richcolorlog>=0.1.0"]
 dev = [
     "pytest>=7.4.0",
@@ -142,6 +144,7 @@ module = [
     "tomllib.*",
     "tomli_w.*",
     "json5.*",
+    "orjson.*",
     "richcolorlog.*",
     "version_get.*"
 ]
@@ -238,6 +241,7 @@ setup(
             "tomli>=2.0.1;python_version<'3.11'",
             "tomli-w>=1.0.0",
             "json5>=0.9.14",
+            "orjson>=3.8.0",
             "richcolorlog>=0.1.0",
         ],
         "yaml": ["pyyaml>=6.0.1"],
@@ -246,6 +250,7 @@ setup(
             "tomli-w>=1.0.0",
         ],
         "json5": ["json5>=0.9.14"],
+        "orjson": ["orjson>=3.8.0"],
         "rich": ["richcolorlog>=0.1.0"],
         "dev": [
             "pytest>=7.4.0",
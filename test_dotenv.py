@@ -3,10 +3,11 @@
 import unittest
 import tempfile
 import os
+import stat
 from pathlib import Path
-from envdot import DotEnv, load_env, get_env, set_env
+from envdot import DotEnv, load_env, load_env_from_string, get_env, set_env
 from envdot.core import TypeDetector
-from envdot.exceptions import FileNotFoundError, ParseError, TypeConversionError
+from envdot.exceptions import DotEnvError, DotEnvFileNotFoundError, ParseError, TypeConversionError
 
 
 class TestTypeDetector(unittest.TestCase):
@@ -39,6 +40,7 @@ class TestTypeDetector(unittest.TestCase):
         self.assertEqual(TypeDetector.auto_detect('0'), 0)
         self.assertEqual(TypeDetector.auto_detect('-456'), -456)
         self.assertIsInstance(TypeDetector.auto_detect('999'), int)
+        self.assertIsInstance(TypeDetector.auto_detect('-456'), int)
     
     def test_float_detection(self):
         """Test float value detection"""
@@ -127,28 +129,47 @@ class TestDotEnvBasic(unittest.TestCase):
         self.assertEqual(len(env.keys()), 2)
         env.clear()
         self.assertEqual(len(env.keys()), 0)
+    
+    def test_dict_round_trip(self):
+        """Test to_dict/from_dict round trip without disk I/O"""
+        env = DotEnv(auto_load=False)
+        env.set('ROUND_TRIP_PORT', 8080, apply_to_os=False)
+        env.set('ROUND_TRIP_DEBUG', False, apply_to_os=False)
+        
+        from unittest import mock
+        with mock.patch.object(DotEnv, '_find_config_file') as finder:
+            copy = DotEnv.from_dict(env.to_dict())
+        finder.assert_not_called()
+        self.assertEqual(copy.to_dict(), env.to_dict())
+        self.assertEqual(copy.get('ROUND_TRIP_PORT'), 8080)
+        self.assertIs(copy.get('ROUND_TRIP_DEBUG'), False)
 
 
 class TestDotEnvFiles(unittest.TestCase):
     """Test file loading and saving"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        """Set up read-only fixtures shared by every test"""
+        cls.temp_dir = tempfile.mkdtemp()
+        (Path(cls.temp_dir) / '.env').write_text(
+            'DEBUG=true\n'
+            'PORT=8080\n'
+            'APP_NAME=TestApp\n'
+        )
+        (Path(cls.temp_dir) / 'config.json').write_text(
+            '{"DEBUG": true, "PORT": 8080, "APP_NAME": "TestApp"}'
+        )
         
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up test fixtures"""
         import shutil
-        shutil.rmtree(self.temp_dir)
+        shutil.rmtree(cls.temp_dir)
     
     def test_load_env_file(self):
         """Test loading .env file"""
         env_file = Path(self.temp_dir) / '.env'
-        env_file.write_text(
-            'DEBUG=true\n'
-            'PORT=8080\n'
-            'APP_NAME=TestApp\n'
-        )
         
         env = DotEnv(env_file, auto_load=False)
         env.load()
@@ -160,7 +181,6 @@ class TestDotEnvFiles(unittest.TestCase):
     def test_load_json_file(self):
         """Test loading JSON file"""
         json_file = Path(self.temp_dir) / 'config.json'
-        json_file.write_text('{"DEBUG": true, "PORT": 8080, "APP_NAME": "TestApp"}')
         
         env = DotEnv(json_file, auto_load=False)
         env.load()
@@ -169,9 +189,144 @@ class TestDotEnvFiles(unittest.TestCase):
         self.assertEqual(env.get('PORT'), 8080)
         self.assertEqual(env.get('APP_NAME'), 'TestApp')
     
+    def test_json_native_types_kept(self):
+        """Test typed JSON values are stored without re-detection"""
+        env = DotEnv(auto_load=False)
+        env.load_string('{"RETRIES": 1, "WORKERS": 0, "RATIO": 1.5, "FLAG": "yes"}',
+                        fmt='json', apply_to_os=False)
+        
+        self.assertIs(type(env.get('RETRIES')), int)
+        self.assertEqual(env.get('RETRIES'), 1)
+        self.assertEqual(env.get('WORKERS'), 0)
+        self.assertEqual(env.get('RATIO'), 1.5)
+        self.assertIs(env.get('FLAG'), True)
+    
+    def test_json_large_int_exact(self):
+        """Test integers wider than 64 bits are read exactly"""
+        from envdot.core import FileHandler
+        
+        big = 123456789012345678901234567890
+        self.assertEqual(FileHandler.parse_json(f'{{"BIG": {big}}}'), {'BIG': big})
+        self.assertEqual(FileHandler.parse_json(f'{{"BIG": {big}}}'.encode()), {'BIG': big})
+    
+    def test_export_prefix(self):
+        """Test shell-style export lines and quoted values"""
+        from envdot.core import FileHandler
+        
+        data = FileHandler.parse_env('export API_KEY = "abc def"\nNAME=\'x\'\n')
+        self.assertEqual(data, {'API_KEY': 'abc def', 'NAME': 'x'})
+        
+        # Comments may follow a quoted value; an unquoted '#' is kept
+        data = FileHandler.parse_env('TOKEN="a b"  # note\nURL=http://x/#top\n')
+        self.assertEqual(data, {'TOKEN': 'a b', 'URL': 'http://x/#top'})
+    
+    def test_ini_simple_parser_matches_configparser(self):
+        """Test the line-based INI parser against configparser"""
+        from envdot.core import FileHandler
+        
+        content = (
+            '[DEFAULT]\napp_name = My App\n\n'
+            '[database]\nhost = localhost\nport: 5432\n; comment\n'
+            '[cache]\nenabled = true\nurl = redis://localhost:6379\n'
+        )
+        self.assertEqual(
+            FileHandler.parse_ini(content),
+            FileHandler.parse_ini(content, use_configparser=True),
+        )
+        self.assertEqual(FileHandler.parse_ini(content)['DATABASE_PORT'], '5432')
+        
+        # Continuation lines fall back to configparser
+        multiline = '[section]\nkey = first\n    second\n'
+        self.assertEqual(FileHandler.parse_ini(multiline), {'SECTION_KEY': 'first\nsecond'})
+    
+    def test_reload_uses_parse_cache(self):
+        """Test unchanged files are served from the parse cache"""
+        from unittest import mock
+        from envdot.core import FileHandler
+        
+        env_file = Path(self.temp_dir) / 'cache.env'
+        env_file.write_text('CACHED_PORT=8080\n')
+        
+        env = DotEnv(env_file, auto_load=False)
+        env.load(apply_to_os=False)
+        with mock.patch.object(FileHandler, 'load_env_file') as loader:
+            env.load(apply_to_os=False)
+        loader.assert_not_called()
+        self.assertEqual(env.get('CACHED_PORT'), 8080)
+        
+        # A changed file (different size) is parsed again
+        env_file.write_text('CACHED_PORT=80800\n')
+        env.load(apply_to_os=False)
+        self.assertEqual(env.get('CACHED_PORT'), 80800)
+    
+    def test_reload_bypasses_parse_cache(self):
+        """Test reload=True sees a same-size edit that kept the mtime"""
+        env_file = Path(self.temp_dir) / 'stale.env'
+        env_file.write_text('STALE_PORT=1111\n')
+        st = os.stat(env_file)
+        
+        env = DotEnv(env_file, auto_load=False)
+        env.load(apply_to_os=False)
+        self.assertEqual(env.get('STALE_PORT'), 1111)
+        
+        env_file.write_text('STALE_PORT=2222\n')
+        os.utime(env_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        try:
+            self.assertEqual(env.get('STALE_PORT', reload=True), 2222)
+        finally:
+            os.environ.pop('STALE_PORT', None)
+    
+    def test_persistent_parse_cache(self):
+        """Test parse results are reused from the on-disk cache"""
+        from unittest import mock
+        from envdot import core
+        from envdot.core import FileHandler
+        
+        env_file = Path(self.temp_dir) / 'persist.env'
+        env_file.write_text('PERSIST_PORT=8080\n')
+        cache_home = Path(self.temp_dir) / 'cache'
+        
+        with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': str(cache_home)}):
+            DotEnv(env_file, auto_load=False, persistent_cache=True).load(apply_to_os=False)
+            entries = list((cache_home / 'envdot').glob('*.json'))
+            self.assertEqual(len(entries), 1)
+            if os.name == 'posix':
+                self.assertEqual(stat.S_IMODE(os.stat(cache_home / 'envdot').st_mode), 0o700)
+                self.assertEqual(stat.S_IMODE(os.stat(entries[0]).st_mode), 0o600)
+            
+            # A fresh process only has the disk copy
+            core._PARSE_CACHE.clear()
+            core._PERSISTED_KEYS.clear()
+            env = DotEnv(env_file, auto_load=False, persistent_cache=True)
+            with mock.patch.object(FileHandler, 'load_env_file') as loader:
+                env.load(apply_to_os=False)
+            loader.assert_not_called()
+            self.assertEqual(env.get('PERSIST_PORT'), 8080)
+            
+            # An edited file replaces its entry rather than adding one
+            env_file.write_text('PERSIST_PORT=80800\n')
+            env.load(apply_to_os=False)
+            self.assertEqual(len(list((cache_home / 'envdot').iterdir())), 1)
+            self.assertEqual(env.get('PERSIST_PORT'), 80800)
+    
+    def test_persistent_cache_written_after_memory_hit(self):
+        """Test a persistent load writes an entry an earlier load cached in memory"""
+        from unittest import mock
+        
+        env_file = Path(self.temp_dir) / 'write_through.env'
+        env_file.write_text('THROUGH_PORT=8080\n')
+        cache_home = Path(self.temp_dir) / 'through_cache'
+        
+        with mock.patch.dict(os.environ, {'XDG_CACHE_HOME': str(cache_home)}):
+            DotEnv(env_file, auto_load=False).load(apply_to_os=False)
+            self.assertFalse((cache_home / 'envdot').exists())
+            
+            DotEnv(env_file, auto_load=False, persistent_cache=True).load(apply_to_os=False)
+            self.assertEqual(len(list((cache_home / 'envdot').glob('*.json'))), 1)
+    
     def test_save_env_file(self):
         """Test saving to .env file"""
-        env_file = Path(self.temp_dir) / '.env'
+        env_file = Path(self.temp_dir) / 'saved.env'
         
         env = DotEnv(auto_load=False)
         env.set('DEBUG', True)
@@ -185,7 +340,7 @@ class TestDotEnvFiles(unittest.TestCase):
     
     def test_save_json_file(self):
         """Test saving to JSON file"""
-        json_file = Path(self.temp_dir) / 'config.json'
+        json_file = Path(self.temp_dir) / 'saved.json'
         
         env = DotEnv(auto_load=False)
         env.set('DEBUG', True)
@@ -200,11 +355,28 @@ class TestDotEnvFiles(unittest.TestCase):
         self.assertEqual(data['DEBUG'], True)
         self.assertEqual(data['PORT'], 8080)
     
+    def test_save_json_non_finite_floats(self):
+        """Test NaN and infinities survive a JSON save and reload"""
+        import math
+        json_file = Path(self.temp_dir) / 'non_finite.json'
+        
+        env = DotEnv(auto_load=False)
+        env.set('RATIO', float('nan'), apply_to_os=False)
+        env.set('LIMIT', float('inf'), apply_to_os=False)
+        env.set('FLOOR', float('-inf'), apply_to_os=False)
+        env.save(json_file)
+        
+        loaded = DotEnv(json_file, auto_load=False)
+        loaded.load(apply_to_os=False)
+        self.assertTrue(math.isnan(loaded.get('RATIO')))
+        self.assertEqual(loaded.get('LIMIT'), float('inf'))
+        self.assertEqual(loaded.get('FLOOR'), float('-inf'))
+    
     def test_file_not_found(self):
         """Test file not found error"""
         env = DotEnv('nonexistent.env', auto_load=False)
         
-        with self.assertRaises(FileNotFoundError):
+        with self.assertRaises(DotEnvFileNotFoundError):
             env.load()
 
 
@@ -262,6 +434,18 @@ class TestConvenienceFunctions(unittest.TestCase):
         value = get_env('TEST_VAR')
         self.assertEqual(value, 'test_value')
     
+    def test_load_env_from_string_function(self):
+        """Test load_env_from_string convenience function"""
+        from unittest import mock
+        with mock.patch.object(DotEnv, '_find_config_file') as finder:
+            load_env_from_string('STRING_PORT=8080\nSTRING_DEBUG=true\n', apply_to_os=False)
+        finder.assert_not_called()
+        self.assertEqual(get_env('STRING_PORT'), 8080)
+        self.assertIs(get_env('STRING_DEBUG'), True)
+        
+        load_env_from_string('{"server": {"host": "localhost"}}', fmt='json', apply_to_os=False)
+        self.assertEqual(get_env('SERVER_HOST'), 'localhost')
+    
     def test_set_env_function(self):
         """Test set_env convenience function"""
         set_env('NEW_VAR', 'new_value')
@@ -269,6 +453,101 @@ class TestConvenienceFunctions(unittest.TestCase):
         self.assertEqual(value, 'new_value')
 
 
+class TestHelpers(unittest.TestCase):
+    """Test os.getenv style helper functions"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        os.environ['HELPER_LIST'] = 'a, b c,,d'
+        
+    def tearDown(self):
+        """Clean up test fixtures"""
+        os.environ.pop('HELPER_LIST', None)
+    
+    def test_cast_to_list(self):
+        """Test splitting on commas and whitespace"""
+        from envdot.helpers import getenv_typed
+        self.assertEqual(getenv_typed('HELPER_LIST', cast_type=list), ['a', 'b', 'c', 'd'])
+    
+    def test_cast_to_tuple(self):
+        """Test tuple casting uses the split parts"""
+        from envdot.helpers import getenv_typed
+        self.assertEqual(getenv_typed('HELPER_LIST', cast_type=tuple), ('a', 'b', 'c', 'd'))
+    
+    def test_bool_spellings_match_dotenv_get(self):
+        """Test getenv_bool and DotEnv.get(cast_type=bool) agree"""
+        from envdot.helpers import getenv_bool
+        env = DotEnv(auto_load=False)
+        try:
+            for raw in ('true', 'Yes', 'on', '1', 't', 'y', 'false', 'off', '0', 'maybe'):
+                os.environ['HELPER_FLAG'] = raw
+                self.assertEqual(getenv_bool('HELPER_FLAG'),
+                                 env.get('HELPER_FLAG', cast_type=bool), raw)
+        finally:
+            os.environ.pop('HELPER_FLAG', None)
+    
+    def test_list_cast_matches_dotenv_get(self):
+        """Test getenv_typed and DotEnv.get split lists the same way"""
+        from envdot.helpers import getenv_typed
+        env = DotEnv(auto_load=False)
+        os.environ['HELPER_LIST'] = 'a\tb, c'
+        self.assertEqual(getenv_typed('HELPER_LIST', cast_type=list), ['a', 'b', 'c'])
+        self.assertEqual(env.get('HELPER_LIST', cast_type=list), ['a', 'b', 'c'])
+        self.assertEqual(env.get('HELPER_LIST', cast_type=tuple), ('a', 'b', 'c'))
+    
+    def test_typed_value_follows_environ(self):
+        """Test repeated reads see direct os.environ changes"""
+        from envdot.helpers import getenv_typed
+        os.environ['HELPER_PORT'] = '8080'
+        try:
+            self.assertEqual(getenv_typed('HELPER_PORT'), 8080)
+            self.assertEqual(getenv_typed('HELPER_PORT'), 8080)
+            os.environ['HELPER_PORT'] = '9090'
+            self.assertEqual(getenv_typed('HELPER_PORT'), 9090)
+        finally:
+            os.environ.pop('HELPER_PORT', None)
+    
+    def test_typed_value_huge_digit_string(self):
+        """Test digit strings past the int size limit match auto_detect"""
+        from envdot.helpers import getenv_typed
+        os.environ['HELPER_HUGE'] = '9' * 5000
+        try:
+            self.assertEqual(getenv_typed('HELPER_HUGE'),
+                             TypeDetector.auto_detect(os.environ['HELPER_HUGE']))
+        finally:
+            os.environ.pop('HELPER_HUGE', None)
+    
+    def test_setenv_typed_many(self):
+        """Test setting several typed values at once"""
+        from envdot.helpers import setenv_typed_many
+        setenv_typed_many({'HELPER_PORT': 8080, 'HELPER_DEBUG': True})
+        try:
+            self.assertEqual(os.environ['HELPER_PORT'], '8080')
+            self.assertEqual(os.environ['HELPER_DEBUG'], 'true')
+        finally:
+            os.environ.pop('HELPER_PORT', None)
+            os.environ.pop('HELPER_DEBUG', None)
+    
+    def test_patch_os_module(self):
+        """Test patching is idempotent and can be undone"""
+        from envdot.helpers import patch_os_module, unpatch_os_module, getenv_int
+        # Start unpatched (load_env patches os) and leave os clean afterwards
+        unpatch_os_module()
+        self.addCleanup(unpatch_os_module)
+        
+        patch_os_module()
+        self.assertIs(os.getenv_int, getenv_int)
+        # A second call is a no-op: it does not overwrite the attributes
+        os.getenv_int = 'sentinel'
+        patch_os_module()
+        self.assertEqual(os.getenv_int, 'sentinel')
+        
+        unpatch_os_module()
+        self.assertFalse(hasattr(os, 'getenv_int'))
+        patch_os_module()
+        self.assertIs(os.getenv_int, getenv_int)
+
+
 class TestMethodChaining(unittest.TestCase):
     """Test method chaining"""
     
@@ -313,5 +592,14 @@ class TestEdgeCases(unittest.TestCase):
         self.assertEqual(value, 'value@with#special$chars')
 
 
+
+class TestExceptions(unittest.TestCase):
+    """Test exception hierarchy"""
+    
+    def test_file_not_found_hierarchy(self):
+        """Test DotEnvFileNotFoundError is an envdot error, not a built-in OSError"""
+        self.assertTrue(issubclass(DotEnvFileNotFoundError, DotEnvError))
+        self.assertFalse(issubclass(DotEnvFileNotFoundError, FileNotFoundError))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
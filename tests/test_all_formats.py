@@ -13,7 +13,7 @@ import shutil
 # Import envdot
 from envdot import (
     DotEnv, load_env, get_env, set_env, save_env,
-    DotEnvError, FileNotFoundError, ParseError
+    DotEnvError, DotEnvFileNotFoundError, ParseError
 )
 
 
@@ -497,6 +497,20 @@ class TestErrorHandling:
                 load_env(toml_file)
         except ImportError:
             pytest.skip("tomli not installed")
+    
+    def test_deprecated_file_not_found_alias(self):
+        """Test the old FileNotFoundError names warn at the caller's import"""
+        from envdot.exceptions import DotEnvFileNotFoundError
+        
+        with pytest.warns(DeprecationWarning, match=r"^envdot\.FileNotFoundError") as record:
+            from envdot import FileNotFoundError as PackageAlias
+        assert PackageAlias is DotEnvFileNotFoundError
+        assert record[0].filename == __file__
+        
+        with pytest.warns(DeprecationWarning, match=r"^envdot\.exceptions\.FileNotFoundError") as record:
+            from envdot.exceptions import FileNotFoundError as ModuleAlias
+        assert ModuleAlias is DotEnvFileNotFoundError
+        assert record[0].filename == __file__
 
 
 class TestAttributeAccess: